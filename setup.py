@@ -9,6 +9,7 @@ base_packages = [
     "pandas>=1.2.1",
     "numpy>=1.18.5",
     "scipy>=1.5.0",
+    "joblib>=0.11",
 ]
 
 test_packages = [
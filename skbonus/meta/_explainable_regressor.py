@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import partial
+from numbers import Integral
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import BaseEstimator, RegressorMixin, clone
-from sklearn.tree import DecisionTreeRegressor
+from sklearn.isotonic import IsotonicRegression, isotonic_regression
+from sklearn.tree import DecisionTreeRegressor, ExtraTreeRegressor
+from sklearn.utils import gen_even_slices
 from sklearn.utils.validation import (
     check_X_y,
     check_is_fitted,
@@ -12,6 +17,388 @@ from sklearn.utils.validation import (
     _check_sample_weight,
 )
 
+# Constants of scikit-learn's tree builder, needed to reproduce its splits.
+_EPSILON = np.finfo(np.float64).eps
+_FEATURE_THRESHOLD = 1e-7
+
+# Deeper trees have too many nodes to beat scikit-learn's own tree builder.
+_MAX_FAST_TREE_DEPTH = 8
+
+_TREE_TYPES = (DecisionTreeRegressor, ExtraTreeRegressor)
+
+
+def _nearest_grid_index(
+    x: np.ndarray,
+    grid_start: Union[float, np.ndarray],
+    grid_step: Union[float, np.ndarray],
+    grid_points: int,
+) -> np.ndarray:
+    """
+    Find the index of the closest point of an evenly spaced grid for each value in `x`.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The values to look up. Can also be of shape (n_samples, n_features) to look up all features at once.
+
+    grid_start : Union[float, np.ndarray]
+        The first point of the grid, or of each feature's grid.
+
+    grid_step : Union[float, np.ndarray]
+        The positive distance between two neighboring grid points, or one per feature.
+
+    grid_points : int
+        The number of grid points.
+
+    Returns
+    -------
+    np.ndarray
+        The indices of the closest grid points, same shape as `x`.
+    """
+    # round half down, so values right between two grid points go to the left one
+    index = np.ceil((x - grid_start) / grid_step - 0.5)
+    np.clip(index, 0, grid_points - 1, out=index)
+
+    # NumPy converts any other integer type to intp before gathering with it, so narrower
+    # types would save memory but slow down every gather with these indices.
+    return index.astype(np.intp)
+
+
+def _apply_round(
+    residuals: np.ndarray,
+    outputs: np.ndarray,
+    grid_predictions: np.ndarray,
+    bin_indices: np.ndarray,
+    learning_rate: float,
+) -> None:
+    """
+    Add the result of a single boosting round to a feature's outputs and remove it from the residuals.
+
+    The learning rate is applied to the grid predictions first, so the per-sample update is a plain gather and subtraction.
+    `residuals` and `outputs` are updated in place, `grid_predictions` is left untouched.
+
+    Parameters
+    ----------
+    residuals : np.ndarray of shape (n_samples,)
+        The current residuals of the training samples.
+
+    outputs : np.ndarray of shape (grid_points,)
+        The outputs of the feature the round was fitted on.
+
+    grid_predictions : np.ndarray of shape (grid_points,)
+        The predictions of the round's base regressor on the feature's grid.
+
+    bin_indices : np.ndarray of shape (n_samples,)
+        The index of the closest grid point for each training sample.
+
+    learning_rate : float
+        The learning rate.
+    """
+    # the base regressor may return integers or an array it still holds on to
+    grid_predictions = np.multiply(grid_predictions, learning_rate, dtype=outputs.dtype)
+    outputs += grid_predictions
+    # Fancy indexing is considerably faster than np.take with an out argument, even with the temporary array.
+    residuals -= grid_predictions[bin_indices]
+
+
+def _is_plain_decision_tree(estimator: Any) -> bool:
+    """
+    Check if an estimator is a depth-limited `DecisionTreeRegressor` with otherwise default parameters.
+
+    Such trees can be fitted by `_fit_tree_1d` instead of scikit-learn.
+
+    Parameters
+    ----------
+    estimator : Any
+        A scikit-learn compatible regressor.
+
+    Returns
+    -------
+    bool
+        Whether `estimator` is a plain decision tree.
+    """
+    if type(estimator) is not DecisionTreeRegressor:
+        return False
+
+    max_depth = estimator.max_depth
+    if (
+        not isinstance(max_depth, Integral)
+        or not 1 <= max_depth <= _MAX_FAST_TREE_DEPTH
+    ):
+        return False
+
+    params = estimator.get_params()
+    default_params = DecisionTreeRegressor().get_params()
+
+    return all(
+        params[param] == default_params[param]
+        for param in params
+        if param not in ("max_depth", "random_state")
+    )
+
+
+def _fit_tree_1d(
+    x_sorted: np.ndarray,
+    y_sorted: np.ndarray,
+    sample_weight_sorted: np.ndarray,
+    max_depth: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fit a regression tree with the squared error criterion on a single, sorted feature.
+
+    The tree is the same as the one of scikit-learn's `DecisionTreeRegressor(max_depth=max_depth)`, but the best split
+    of each node is found with cumulative sums over the sorted samples instead of scikit-learn's generic tree builder.
+
+    Parameters
+    ----------
+    x_sorted : np.ndarray of shape (n_samples,)
+        The sorted feature values, as float32 like scikit-learn uses them.
+
+    y_sorted : np.ndarray of shape (n_samples,)
+        The targets in the order of `x_sorted`.
+
+    sample_weight_sorted : np.ndarray of shape (n_samples,)
+        The sample weights in the order of `x_sorted`.
+
+    max_depth : int
+        The maximum depth of the tree.
+
+    Returns
+    -------
+    thresholds : np.ndarray of shape (n_leaves - 1,)
+        The sorted split thresholds. A value `x` falls into leaf `np.searchsorted(thresholds, x)`.
+
+    leaf_values : np.ndarray of shape (n_leaves,)
+        The predictions of the leaves from left to right.
+    """
+    weighted_y = sample_weight_sorted * y_sorted
+    thresholds = []
+    leaf_values = []
+
+    def grow(start, end, depth):
+        weights = sample_weight_sorted[start:end]
+        weighted_targets = weighted_y[start:end]
+        total_weight = weights.sum()
+        total_weighted_target = weighted_targets.sum()
+        mean = total_weighted_target / total_weight
+
+        if depth < max_depth and end - start > 1:
+            impurity = np.dot(weighted_targets, y_sorted[start:end]) / total_weight
+            impurity -= mean**2
+            if impurity > _EPSILON:
+                left_weight = np.cumsum(weights[:-1])
+                left_weighted_target = np.cumsum(weighted_targets[:-1])
+                right_weight = total_weight - left_weight
+                x = x_sorted[start:end]
+                valid = (
+                    (x[1:] > x[:-1] + _FEATURE_THRESHOLD)
+                    & (left_weight > 0)
+                    & (right_weight > 0)
+                )
+                if valid.any():
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        proxy_improvement = (
+                            left_weighted_target**2 / left_weight
+                            + (total_weighted_target - left_weighted_target) ** 2
+                            / right_weight
+                        )
+                    proxy_improvement[~valid] = -np.inf
+                    split = start + np.argmax(proxy_improvement) + 1
+
+                    threshold = x_sorted[split - 1] / 2.0 + x_sorted[split] / 2.0
+                    if threshold == x_sorted[split] or np.isinf(threshold):
+                        threshold = float(x_sorted[split - 1])
+
+                    grow(start, split, depth + 1)
+                    thresholds.append(threshold)
+                    grow(split, end, depth + 1)
+                    return
+
+        leaf_values.append(mean)
+
+    grow(0, len(x_sorted), 0)
+
+    return np.array(thresholds), np.array(leaf_values)
+
+
+def _fit_round_tree(
+    max_depth: int,
+    sort_index: np.ndarray,
+    x_sorted: np.ndarray,
+    sample_weight_sorted: np.ndarray,
+    grid: np.ndarray,
+    residuals: np.ndarray,
+) -> np.ndarray:
+    """
+    Fit a single boosting round with `_fit_tree_1d` and predict on the grid.
+
+    Parameters
+    ----------
+    max_depth : int
+        The maximum depth of the tree.
+
+    sort_index : np.ndarray of shape (n_samples,)
+        The indices that sort the feature.
+
+    x_sorted : np.ndarray of shape (n_samples,)
+        The sorted feature values as float32.
+
+    sample_weight_sorted : np.ndarray of shape (n_samples,)
+        The sample weights in the order of `x_sorted`.
+
+    grid : np.ndarray of shape (grid_points,)
+        The grid of the feature as float32.
+
+    residuals : np.ndarray of shape (n_samples,)
+        The current residuals to fit.
+
+    Returns
+    -------
+    np.ndarray of shape (grid_points,)
+        The predictions of the tree on the grid.
+    """
+    thresholds, leaf_values = _fit_tree_1d(
+        x_sorted, residuals[sort_index], sample_weight_sorted, max_depth
+    )
+
+    return leaf_values[np.searchsorted(thresholds, grid)]
+
+
+def _predict_on_grid(estimator: Any, grid: np.ndarray) -> np.ndarray:
+    """
+    Get the predictions of a base regressor fitted on a single feature for the feature's grid.
+
+    For trees and isotonic regressions, the predictions are read from the fitted structure directly, skipping the input
+    validation of `predict`. The results are the same.
+
+    Parameters
+    ----------
+    estimator : Any
+        A fitted scikit-learn compatible regressor.
+
+    grid : np.ndarray of shape (grid_points, 1)
+        The sorted grid of the feature. For trees, it can already be cast to float32 to avoid a conversion.
+
+    Returns
+    -------
+    np.ndarray of shape (grid_points,)
+        The predictions on the grid.
+    """
+    if type(estimator) in _TREE_TYPES:
+        return estimator.tree_.predict(grid.astype(np.float32, copy=False))[:, 0]
+
+    if type(estimator) is IsotonicRegression and (
+        estimator.out_of_bounds == "clip"
+        or estimator.X_min_ <= grid[0, 0] <= grid[-1, 0] <= estimator.X_max_
+    ):
+        return np.interp(grid[:, 0], estimator.X_thresholds_, estimator.y_thresholds_)
+
+    return estimator.predict(grid)
+
+
+def _fit_round(
+    regressor: Any,
+    x: np.ndarray,
+    grid: np.ndarray,
+    sample_weight: np.ndarray,
+    residuals: np.ndarray,
+) -> np.ndarray:
+    """
+    Fit a base regressor on the residuals and predict on the grid.
+
+    The same unfitted regressor is refitted in every round since fit discards the previous state. Only warm-started
+    regressors build upon it, so these are cloned first.
+
+    Parameters
+    ----------
+    regressor : Any
+        An unfitted clone of the feature's base regressor.
+
+    x : np.ndarray of shape (n_samples, 1)
+        The feature column.
+
+    grid : np.ndarray of shape (grid_points, 1)
+        The grid of the feature.
+
+    sample_weight : np.ndarray of shape (n_samples,)
+        The sample weights.
+
+    residuals : np.ndarray of shape (n_samples,)
+        The current residuals.
+
+    Returns
+    -------
+    np.ndarray of shape (grid_points,)
+        The predictions of the fitted regressor on the grid.
+    """
+    if getattr(regressor, "warm_start", False):
+        regressor = clone(regressor)
+    regressor.fit(x, residuals, sample_weight=sample_weight)
+
+    return _predict_on_grid(regressor, grid)
+
+
+def _fit_round_isotonic(
+    estimator: IsotonicRegression,
+    sort_index: np.ndarray,
+    group_starts: np.ndarray,
+    sample_weight_sorted: np.ndarray,
+    group_weights: np.ndarray,
+    x_unique: np.ndarray,
+    grid: np.ndarray,
+    residuals: np.ndarray,
+) -> np.ndarray:
+    """
+    Fit a single boosting round with an isotonic regression on presorted data and predict on the grid.
+
+    This yields the same predictions as fitting `estimator` and predicting with it, but the sorting and grouping of
+    equal feature values is done only once before boosting.
+
+    Parameters
+    ----------
+    estimator : IsotonicRegression
+        The isotonic regression to take the parameters from. `increasing` has to be a bool.
+
+    sort_index : np.ndarray of shape (n_samples,)
+        The indices that sort the feature, without samples of zero weight.
+
+    group_starts : np.ndarray of shape (n_unique,)
+        The positions in the sorted feature where a new value starts.
+
+    sample_weight_sorted : np.ndarray of shape (n_samples,)
+        The sample weights in the order of the sorted feature.
+
+    group_weights : np.ndarray of shape (n_unique,)
+        The summed sample weights per unique feature value.
+
+    x_unique : np.ndarray of shape (n_unique,)
+        The unique feature values in ascending order.
+
+    grid : np.ndarray of shape (grid_points,)
+        The grid of the feature.
+
+    residuals : np.ndarray of shape (n_samples,)
+        The current residuals to fit.
+
+    Returns
+    -------
+    np.ndarray of shape (grid_points,)
+        The predictions of the isotonic regression on the grid.
+    """
+    y_unique = (
+        np.add.reduceat(sample_weight_sorted * residuals[sort_index], group_starts)
+        / group_weights
+    )
+    y_fitted = isotonic_regression(
+        y_unique,
+        sample_weight=group_weights,
+        y_min=estimator.y_min,
+        y_max=estimator.y_max,
+        increasing=estimator.increasing,
+    )
+
+    return np.interp(grid, x_unique, y_fitted)
+
 
 class ExplainableBoostingMetaRegressor(BaseEstimator, RegressorMixin):
     """
@@ -41,6 +428,17 @@ class ExplainableBoostingMetaRegressor(BaseEstimator, RegressorMixin):
             - the better the model performs, but
             - the slower the algorithm gets.
 
+    n_jobs : Optional[int], default=None
+        The number of threads used for fitting the base regressors and for predicting. None means 1, -1 means using
+        all processors.
+        With more than one job, the boosting runs in sweeps over all features: within a sweep, the base regressors
+        of all features are fitted in parallel on the same residuals. Hence, the outputs differ slightly from the
+        ones of the sequential fit.
+
+    dtype : type, default=np.float64
+        The floating point type of the residuals and the outputs. Using np.float32 halves the memory that has to be
+        read and written during boosting, at the cost of precision.
+
     Examples
     --------
     >>> import numpy as np
@@ -53,17 +451,17 @@ class ExplainableBoostingMetaRegressor(BaseEstimator, RegressorMixin):
     ...         grid_points=20
     ... ).fit(X, y)
     >>> e.score(X, y)
-    0.9377382292348461
+    0.9390426399324752
     >>> e.outputs_[0] # increasing in the first feature, as it should be
-    array([-4.47984456, -4.47984456, -4.47984456, -4.47984456, -3.00182713,
-           -2.96627696, -1.60843287, -1.06601264, -0.92013822, -0.7217753 ,
-           -0.66440783,  0.28132994,  1.33664486,  1.47592253,  1.96677286,
-            2.88969439,  2.96292906,  4.33642573,  4.38506967,  6.42967225])
+    array([-4.5747583 , -4.5747583 , -4.5747583 , -4.5747583 , -3.03227396,
+           -2.95668517, -1.56864051, -1.15784663, -1.05186211, -0.67612564,
+           -0.50416922,  0.40376419,  1.57544718,  1.64074219,  2.28295741,
+            3.6292583 ,  3.62973091,  4.68232091,  4.72466036,  6.52773874])
     >>> e.outputs_[1] # decreasing in the second feature, as it should be
-    array([ 6.35605214,  6.06407947,  6.05458114,  4.8488004 ,  4.41880876,
-            3.45056373,  2.64560385,  1.6138303 ,  0.89860987,  0.458301  ,
-            0.33455608, -0.43609495, -1.55600464, -2.05142528, -2.42791679,
-           -3.58961475, -4.80134218, -4.94421252, -5.94858712, -6.36828774])
+    array([ 7.17503883,  7.08764712,  7.08480413,  4.80960467,  4.33793045,
+            3.71000473,  2.82126082,  1.98552157,  1.33677792,  0.68009257,
+            0.63803446, -0.79236573, -1.65449769, -2.14761006, -2.65341612,
+           -3.24588552, -4.62520848, -4.79946591, -5.98328073, -6.79805471])
 
     Notes
     -----
@@ -77,12 +475,16 @@ class ExplainableBoostingMetaRegressor(BaseEstimator, RegressorMixin):
         max_rounds: int = 5000,
         learning_rate: float = 0.01,
         grid_points: int = 1000,
+        n_jobs: Optional[int] = None,
+        dtype: type = np.float64,
     ) -> None:
         """Initialize."""
         self.base_regressor = base_regressor
         self.max_rounds = max_rounds
         self.learning_rate = learning_rate
         self.grid_points = grid_points
+        self.n_jobs = n_jobs
+        self.dtype = dtype
 
     def fit(
         self, X: np.ndarray, y: np.ndarray, sample_weight: np.ndarray = None
@@ -103,7 +505,7 @@ class ExplainableBoostingMetaRegressor(BaseEstimator, RegressorMixin):
         ExplainableBoostingMetaRegressor
             Fitted regressor.
         """
-        X, y = check_X_y(X, y)
+        X, y = check_X_y(X, y, y_numeric=True, order="F")
         sample_weight = _check_sample_weight(sample_weight, X)
         self._check_n_features(X, reset=True)
 
@@ -125,30 +527,158 @@ class ExplainableBoostingMetaRegressor(BaseEstimator, RegressorMixin):
         if self.learning_rate <= 0:
             raise ValueError("learning_rate has to be positive!")
 
+        if not sample_weight.sum() > 0:
+            raise ValueError("The sum of sample_weight has to be positive!")
+
+        feature_mins, feature_maxs = X.min(axis=0), X.max(axis=0)
         self.domains_ = [
             np.linspace(feature_min, feature_max, self.grid_points)
-            for feature_min, feature_max in zip(X.min(axis=0), X.max(axis=0))
+            for feature_min, feature_max in zip(feature_mins, feature_maxs)
         ]
-        self.outputs_ = [np.zeros_like(domain) for domain in self.domains_]
+        grid_steps = (feature_maxs - feature_mins) / max(self.grid_points - 1, 1)
+        self._grid_starts_ = feature_mins
+        self._grid_steps_ = np.where(grid_steps > 0, grid_steps, 1.0)
+        self.outputs_ = np.zeros((self.n_features_in_, self.grid_points), self.dtype)
         self.mean_ = y.mean()
 
-        y_copy = y.copy() - self.mean_
+        y_copy = (y - self.mean_).astype(self.dtype, copy=False)
+        bin_indices = [
+            _nearest_grid_index(
+                X[:, feature_number],
+                self._grid_starts_[feature_number],
+                self._grid_steps_[feature_number],
+                self.grid_points,
+            )
+            for feature_number in range(self.n_features_in_)
+        ]
+
+        round_fitters = [
+            self._make_round_fitter(X, sample_weight, feature_number)
+            for feature_number in range(self.n_features_in_)
+        ]
 
-        self._fit(X, sample_weight, y_copy)
+        self._fit(y_copy, bin_indices, round_fitters)
 
         return self
 
-    def _fit(self, X, sample_weight, y_copy):
-        for i in range(self.max_rounds):
-            feature_number = i % self.n_features_in_
-            h = clone(self.base_regressors_[feature_number])
-            x = X[:, feature_number].reshape(-1, 1)
-            h.fit(x, y_copy, sample_weight=sample_weight)
+    def _make_round_fitter(
+        self, X: np.ndarray, sample_weight: np.ndarray, feature_number: int
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Create a function that fits a single boosting round of a feature.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_samples, n_features)
+            The training data.
+
+        sample_weight : np.ndarray of shape (n_samples,)
+            The sample weights.
+
+        feature_number : int
+            The feature to create the function for.
+
+        Returns
+        -------
+        Callable[[np.ndarray], np.ndarray]
+            A function that takes the current residuals, fits the feature's base regressor on them and returns its
+            predictions on the feature's grid.
+        """
+        base_regressor = self.base_regressors_[feature_number]
+
+        if _is_plain_decision_tree(base_regressor):
+            sort_index = np.argsort(X[:, feature_number])
+            # scikit-learn's tree builder ignores samples without weight
+            sort_index = sort_index[sample_weight[sort_index] != 0]
+            return partial(
+                _fit_round_tree,
+                base_regressor.max_depth,
+                sort_index,
+                X[sort_index, feature_number].astype(np.float32),
+                sample_weight[sort_index],
+                self.domains_[feature_number].astype(np.float32),
+            )
 
-            self.outputs_[feature_number] += self.learning_rate * h.predict(
-                self.domains_[feature_number].reshape(-1, 1)
+        if type(base_regressor) is IsotonicRegression and isinstance(
+            base_regressor.increasing, bool
+        ):
+            sort_index = np.argsort(X[:, feature_number], kind="mergesort")
+            # scikit-learn's isotonic regression ignores samples without positive weight
+            sort_index = sort_index[sample_weight[sort_index] > 0]
+            x_unique, group_starts = np.unique(
+                X[sort_index, feature_number], return_index=True
             )
-            y_copy -= self.learning_rate * h.predict(x)
+            grid = self.domains_[feature_number]
+            if len(x_unique) > 0 and (
+                base_regressor.out_of_bounds == "clip"
+                or x_unique[0] <= grid[0] <= grid[-1] <= x_unique[-1]
+            ):
+                sample_weight_sorted = sample_weight[sort_index]
+                return partial(
+                    _fit_round_isotonic,
+                    base_regressor,
+                    sort_index,
+                    group_starts,
+                    sample_weight_sorted,
+                    np.add.reduceat(sample_weight_sorted, group_starts),
+                    x_unique,
+                    grid,
+                )
+
+        grid = self.domains_[feature_number].reshape(-1, 1)
+        if type(base_regressor) in _TREE_TYPES:
+            grid = grid.astype(np.float32)
+
+        return partial(
+            _fit_round,
+            clone(base_regressor),
+            np.ascontiguousarray(X[:, feature_number : feature_number + 1]),
+            grid,
+            sample_weight,
+        )
+
+    def _fit(
+        self,
+        y_copy: np.ndarray,
+        bin_indices: List[np.ndarray],
+        round_fitters: List[Callable[[np.ndarray], np.ndarray]],
+    ) -> None:
+        n_sweeps, n_remaining_rounds = divmod(self.max_rounds, self.n_features_in_)
+        if effective_n_jobs(self.n_jobs) == 1:
+            for _ in range(n_sweeps):
+                for feature_number in range(self.n_features_in_):
+                    self._boost_feature(
+                        y_copy, bin_indices, round_fitters, feature_number
+                    )
+        else:
+            with Parallel(n_jobs=self.n_jobs, prefer="threads") as parallel:
+                for _ in range(n_sweeps):
+                    all_grid_predictions = parallel(
+                        delayed(round_fitter)(y_copy) for round_fitter in round_fitters
+                    )
+                    for feature_number, grid_predictions in enumerate(
+                        all_grid_predictions
+                    ):
+                        _apply_round(
+                            y_copy,
+                            self.outputs_[feature_number],
+                            grid_predictions,
+                            bin_indices[feature_number],
+                            self.learning_rate,
+                        )
+
+        for feature_number in range(n_remaining_rounds):
+            self._boost_feature(y_copy, bin_indices, round_fitters, feature_number)
+
+    def _boost_feature(self, y_copy, bin_indices, round_fitters, feature_number):
+        grid_predictions = round_fitters[feature_number](y_copy)
+        _apply_round(
+            y_copy,
+            self.outputs_[feature_number],
+            grid_predictions,
+            bin_indices[feature_number],
+            self.learning_rate,
+        )
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -168,15 +698,22 @@ class ExplainableBoostingMetaRegressor(BaseEstimator, RegressorMixin):
         check_is_fitted(self)
         self._check_n_features(X, reset=False)
 
-        n = len(X)
-        res = np.zeros(n)
-        for feature_number in range(self.n_features_in_):
-            grid = self.domains_[feature_number]
-            feature_outputs = self.outputs_[feature_number][
-                np.abs(
-                    np.repeat(grid.reshape(-1, 1), n, axis=1) - X[:, feature_number]
-                ).argmin(axis=0)
-            ]
-            res += feature_outputs
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            res = self._sum_outputs(X)
+        else:
+            res = np.concatenate(
+                Parallel(n_jobs=n_jobs, prefer="threads")(
+                    delayed(self._sum_outputs)(X[rows])
+                    for rows in gen_even_slices(len(X), n_jobs)
+                )
+            )
 
         return res + self.mean_
+
+    def _sum_outputs(self, X):
+        nearest = _nearest_grid_index(
+            X, self._grid_starts_, self._grid_steps_, self.grid_points
+        )
+
+        return self.outputs_[np.arange(self.n_features_in_), nearest].sum(axis=1)
@@ -18,6 +18,9 @@ from .. import ZeroInflatedRegressor, ExplainableBoostingMetaRegressor
         ExplainableBoostingMetaRegressor(
             base_regressor=DecisionTreeRegressor(), max_rounds=500
         ),
+        ExplainableBoostingMetaRegressor(
+            base_regressor=DecisionTreeRegressor(), max_rounds=500, n_jobs=2
+        ),
     ],
 )
 def test_check_estimator(model):
@@ -0,0 +1,147 @@
+"""Test the ExplainableBoostingMetaRegressor."""
+
+import numpy as np
+import pytest
+from sklearn.dummy import DummyRegressor
+from sklearn.isotonic import IsotonicRegression
+from sklearn.tree import DecisionTreeRegressor
+
+from .. import ExplainableBoostingMetaRegressor
+from .._explainable_regressor import _fit_round_tree
+
+
+@pytest.mark.parametrize("max_depth", [1, 2, 4, 6])
+@pytest.mark.parametrize("seed", range(5))
+def test_fit_round_tree(max_depth, seed):
+    """Test if the fast tree fitting yields the same predictions as scikit-learn's DecisionTreeRegressor."""
+    rng = np.random.RandomState(seed)
+    x = np.round(rng.randn(300), 1)
+    y = rng.randn(300)
+    sample_weight = rng.uniform(0, 2, size=300)
+    sample_weight[:50] = 0
+    grid = np.linspace(x.min(), x.max(), 100)
+
+    tree = DecisionTreeRegressor(max_depth=max_depth)
+    tree.fit(x.reshape(-1, 1), y, sample_weight=sample_weight)
+
+    sort_index = np.argsort(x)
+    sort_index = sort_index[sample_weight[sort_index] != 0]
+
+    np.testing.assert_allclose(
+        _fit_round_tree(
+            max_depth,
+            sort_index,
+            x[sort_index].astype(np.float32),
+            sample_weight[sort_index],
+            grid.astype(np.float32),
+            y,
+        ),
+        tree.predict(grid.reshape(-1, 1)),
+    )
+
+
+class _IsotonicRegressionWithoutFastPath(IsotonicRegression):
+    """Isotonic regression that is fitted via scikit-learn in every boosting round."""
+
+
+@pytest.mark.parametrize("increasing", [True, False])
+def test_isotonic_fast_path(increasing):
+    """Test if the fast isotonic boosting rounds yield the same outputs as scikit-learn's IsotonicRegression."""
+    rng = np.random.RandomState(0)
+    X = np.round(rng.randn(300, 2), 1)
+    y = X[:, 0] - X[:, 1] + rng.randn(300)
+    sample_weight = rng.uniform(0, 2, size=300)
+    sample_weight[50:100] = 0
+
+    fast = ExplainableBoostingMetaRegressor(
+        base_regressor=IsotonicRegression(increasing=increasing), max_rounds=50
+    ).fit(X, y, sample_weight)
+    slow = ExplainableBoostingMetaRegressor(
+        base_regressor=_IsotonicRegressionWithoutFastPath(increasing=increasing),
+        max_rounds=50,
+    ).fit(X, y, sample_weight)
+
+    np.testing.assert_allclose(fast.outputs_, slow.outputs_)
+
+
+@pytest.mark.parametrize("integer_features", [False, True])
+def test_predict_uses_closest_grid_points(integer_features):
+    """Test if predict looks up the outputs of the closest grid points, also outside of the training range."""
+    rng = np.random.RandomState(0)
+    if integer_features:
+        # a grid step of 0.5 puts the quarter values exactly between two grid points
+        X = rng.randint(0, 5, size=(200, 3)).astype(float)
+        grid_points = 9
+        X_new = np.repeat(np.arange(-1, 5.25, 0.25), 3).reshape(-1, 3)
+    else:
+        X = rng.randn(200, 3)
+        grid_points = 50
+        X_new = 2 * rng.randn(100, 3)
+    y = X[:, 0] ** 2 + X[:, 1] - X[:, 2] + rng.randn(200)
+    e = ExplainableBoostingMetaRegressor(max_rounds=30, grid_points=grid_points).fit(
+        X, y
+    )
+
+    expected = e.mean_ + sum(
+        e.outputs_[feature_number][
+            np.abs(
+                e.domains_[feature_number].reshape(-1, 1) - X_new[:, feature_number]
+            ).argmin(axis=0)
+        ]
+        for feature_number in range(3)
+    )
+
+    np.testing.assert_allclose(e.predict(X_new), expected)
+
+
+@pytest.mark.parametrize(
+    "base_regressor",
+    [
+        DecisionTreeRegressor(max_depth=2),
+        IsotonicRegression(),
+        _IsotonicRegressionWithoutFastPath(),
+    ],
+)
+def test_float32_outputs(base_regressor):
+    """Test if fitting with dtype=np.float32 stores float32 outputs close to the float64 ones."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(300, 2)
+    y = X[:, 0] + 2 * X[:, 1] + rng.randn(300)
+
+    e64 = ExplainableBoostingMetaRegressor(
+        base_regressor=base_regressor, max_rounds=50
+    ).fit(X, y)
+    e32 = ExplainableBoostingMetaRegressor(
+        base_regressor=base_regressor, max_rounds=50, dtype=np.float32
+    ).fit(X, y)
+
+    assert e32.outputs_.dtype == np.float32
+    np.testing.assert_allclose(e32.outputs_, e64.outputs_, rtol=1e-4, atol=1e-4)
+    np.testing.assert_allclose(e32.predict(X), e64.predict(X), rtol=1e-4, atol=1e-4)
+
+
+def test_integer_round_predictions():
+    """Test if base regressors predicting integers are boosted like ones predicting the same floats."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(100, 2)
+    y = rng.randn(100)
+
+    e_int = ExplainableBoostingMetaRegressor(
+        base_regressor=DummyRegressor(strategy="constant", constant=1), max_rounds=10
+    ).fit(X, y)
+    e_float = ExplainableBoostingMetaRegressor(
+        base_regressor=DummyRegressor(strategy="constant", constant=1.0),
+        max_rounds=10,
+    ).fit(X, y)
+
+    np.testing.assert_allclose(e_int.outputs_, e_float.outputs_)
+
+
+def test_zero_sample_weights():
+    """Test if fitting without any sample weight raises an error."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(50, 2)
+    y = rng.randn(50)
+
+    with pytest.raises(ValueError, match="sample_weight"):
+        ExplainableBoostingMetaRegressor().fit(X, y, np.zeros(50))
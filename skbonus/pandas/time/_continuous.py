@@ -7,6 +7,10 @@ import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted, check_array
 
+from ..utils import _nanoseconds
+
+_DAY_NS = pd.Timedelta(days=1).value
+
 
 class BaseContinuousTransformer(BaseEstimator, TransformerMixin):
     """
@@ -98,6 +102,7 @@ class PowerTrend(BaseContinuousTransformer):
     origin_date : Optional[Union[str, pd.Timestamp]], default=None
         A date the trend originates from, i.e. the value of the trend column is zero for this date.
         If None, the transformer uses the smallest date of the training set during fit time.
+        A date without timezone is taken as a wall time in the timezone of the training set's index.
 
     Examples
     --------
@@ -150,7 +155,16 @@ class PowerTrend(BaseContinuousTransformer):
         if self.origin_date is None:
             self.origin_ = X.index.min()
         else:
-            self.origin_ = pd.Timestamp(self.origin_date, freq=self.freq_)
+            self.origin_ = pd.Timestamp(self.origin_date)
+            if self.origin_.tz is None and X.index.tz is not None:
+                # a naive origin is a wall time in the timezone of the index
+                self.origin_ = self.origin_.tz_localize(X.index.tz)
+
+        self._origin_ns_ = self.origin_.value
+        if isinstance(self.freq_, pd.tseries.offsets.Tick):
+            self._freq_ns_ = self.freq_.nanos
+        else:
+            self._freq_ns_ = None
 
         return self
 
@@ -173,7 +187,50 @@ class PowerTrend(BaseContinuousTransformer):
         check_array(X, dtype=None)
         self._check_n_features(X, reset=False)
 
-        extended_index = self._make_continuous_time_index(X, start=self.origin_)
-        dummy_dates = pd.Series(np.arange(len(extended_index)), index=extended_index)
+        if self._freq_ns_ is None or (
+            X.index.tz is not None and self._freq_ns_ >= _DAY_NS
+        ):
+            # calendar days of a tz-aware index may last 23 or 25 hours around DST changes
+            extended_index = self._make_continuous_time_index(X, start=self.origin_)
+            dummy_dates = pd.Series(
+                np.arange(len(extended_index)), index=extended_index
+            )
+
+            return X.assign(trend=dummy_dates.reindex(X.index) ** self.power)
+
+        steps = self._steps(X.index)
+        # numpy only takes its shortcuts for powers like 1, 2 or 0.5 on float arrays
+        steps = steps.astype(np.result_type(steps, self.power), copy=False)
+
+        return X.assign(trend=steps**self.power)
+
+    def _steps(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Compute the positions of the dates in the continuous time range starting at the origin.
+
+        Parameters
+        ----------
+        index : pd.DatetimeIndex
+            The dates to compute the positions of.
+
+        Returns
+        -------
+        np.ndarray
+            The positions, or NaN for dates that are not part of the time range.
+        """
+        if index.freq == self.freq_:
+            first_step, remainder = divmod(
+                index[0].value - self._origin_ns_, self._freq_ns_
+            )
+            if remainder == 0 and first_step >= 0:
+                # a regular index on the grid of the trend consists of consecutive steps
+                return np.arange(first_step, first_step + len(index))
+
+        steps, remainders = np.divmod(
+            _nanoseconds(index) - self._origin_ns_, self._freq_ns_
+        )
+        on_grid = (remainders == 0) & (steps >= 0)
+        if on_grid.all():
+            return steps
 
-        return X.assign(trend=dummy_dates.reindex(X.index) ** self.power)
+        return np.where(on_grid, steps, np.nan)
@@ -7,6 +7,23 @@ import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted, check_array
 
+from ..utils import _nanoseconds
+
+_MAX_DIRECT_DATE_COMPARISONS = 16
+_TIME_FEATURES = [
+    "second",
+    "minute",
+    "hour",
+    "day_of_week",
+    "day_of_month",
+    "day_of_year",
+    "week_of_month",
+    "week_of_year",
+    "month",
+    "year",
+]
+_CALENDAR_FEATURES = {"day_of_month", "day_of_year", "week_of_month", "month", "year"}
+
 
 class SimpleTimeFeatures(BaseEstimator, TransformerMixin):
     """
@@ -86,64 +103,16 @@ class SimpleTimeFeatures(BaseEstimator, TransformerMixin):
         self.month = month
         self.year = year
 
-    def _add_second(self, X: pd.DataFrame) -> pd.DataFrame:
-        return X.assign(second=lambda df: df.index.second) if self.second else X
-
-    def _add_minute(self, X: pd.DataFrame) -> pd.DataFrame:
-        return X.assign(minute=lambda df: df.index.minute) if self.minute else X
-
-    def _add_hour(self, X: pd.DataFrame) -> pd.DataFrame:
-        return X.assign(hour=lambda df: df.index.hour) if self.hour else X
-
-    def _add_day_of_week(self, X: pd.DataFrame) -> pd.DataFrame:
-        return (
-            X.assign(day_of_week=lambda df: df.index.weekday + 1)
-            if self.day_of_week
-            else X
-        )
-
-    def _add_day_of_month(self, X: pd.DataFrame) -> pd.DataFrame:
-        return (
-            X.assign(day_of_month=lambda df: df.index.day) if self.day_of_month else X
-        )
-
-    def _add_day_of_year(self, X: pd.DataFrame) -> pd.DataFrame:
-        return (
-            X.assign(day_of_year=lambda df: df.index.dayofyear)
-            if self.day_of_year
-            else X
-        )
-
-    def _add_week_of_month(self, X: pd.DataFrame) -> pd.DataFrame:
-        return (
-            X.assign(week_of_month=lambda df: np.ceil(df.index.day / 7).astype(int))
-            if self.week_of_month
-            else X
-        )
-
-    def _add_week_of_year(self, X: pd.DataFrame) -> pd.DataFrame:
-        return (
-            X.assign(week_of_year=lambda df: df.index.isocalendar().week)
-            if self.week_of_year
-            else X
-        )
-
-    def _add_month(self, X: pd.DataFrame) -> pd.DataFrame:
-        return X.assign(month=lambda df: df.index.month) if self.month else X
-
-    def _add_year(self, X: pd.DataFrame) -> pd.DataFrame:
-        return X.assign(year=lambda df: df.index.year) if self.year else X
-
     def fit(self, X: pd.DataFrame, y: Any = None) -> SimpleTimeFeatures:
         """
         Fit the estimator.
 
-        In this special case, nothing is done.
+        In this special case, only the chosen time features are recorded.
 
         Parameters
         ----------
-        X : Ignored
-            Not used, present here for API consistency by convention.
+        X : pd.DataFrame
+            Only used for checking the number of features.
 
         y : Ignored
             Not used, present here for API consistency by convention.
@@ -154,6 +123,9 @@ class SimpleTimeFeatures(BaseEstimator, TransformerMixin):
             Fitted transformer.
         """
         self._check_n_features(X, reset=True)
+        self._enabled_ = [
+            feature for feature in _TIME_FEATURES if getattr(self, feature)
+        ]
 
         return self
 
@@ -175,19 +147,81 @@ class SimpleTimeFeatures(BaseEstimator, TransformerMixin):
         check_array(X, dtype=None)
         self._check_n_features(X, reset=False)
 
-        res = (
-            X.pipe(self._add_second)
-            .pipe(self._add_minute)
-            .pipe(self._add_hour)
-            .pipe(self._add_day_of_week)
-            .pipe(self._add_day_of_month)
-            .pipe(self._add_day_of_year)
-            .pipe(self._add_week_of_month)
-            .pipe(self._add_week_of_year)
-            .pipe(self._add_month)
-            .pipe(self._add_year)
+        if not self._enabled_:
+            return X
+
+        features = pd.DataFrame(
+            self._compute_features(X.index), index=X.index, columns=self._enabled_
+        )
+        if not X.columns.intersection(features.columns).empty:
+            return X.assign(**features)
+
+        # appending a single frame keeps all new integer columns in one block
+        return pd.concat([X, features], axis=1)
+
+    def _compute_features(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Compute all chosen time features from the integer nanoseconds of the index in a single pass.
+
+        Parameters
+        ----------
+        index : pd.DatetimeIndex
+            The index to extract the time features from.
+
+        Returns
+        -------
+        np.ndarray of shape (n_samples, n_chosen_features)
+            The chosen time features in the order of `_enabled_`, as a column-major array.
+        """
+        wall_time = index.tz_localize(None) if index.tz is not None else index
+        seconds = _nanoseconds(wall_time) // 10**9
+        days, seconds_of_day = np.divmod(seconds, 86400)
+        if any(feature in _CALENDAR_FEATURES for feature in self._enabled_):
+            dates = days.astype("datetime64[D]")
+            months = dates.astype("datetime64[M]")
+            years = dates.astype("datetime64[Y]")
+            day_of_month = (dates - months).astype(np.int64) + 1
+
+        # the features are written into the rows of a single block that backs the new columns
+        block = np.empty(
+            (len(self._enabled_), len(index)),
+            dtype=np.float64 if index.hasnans else np.int64,
         )
-        return res
+        # the rows follow the features chosen during fit, even if the flags were changed since
+        rows = dict(zip(self._enabled_, block))
+        if "second" in rows:
+            np.remainder(seconds_of_day, 60, out=rows["second"])
+        if "minute" in rows:
+            np.remainder(seconds_of_day // 60, 60, out=rows["minute"])
+        if "hour" in rows:
+            np.floor_divide(seconds_of_day, 3600, out=rows["hour"])
+        if "day_of_week" in rows:
+            # 1970-01-01 was a Thursday
+            np.add((days + 3) % 7, 1, out=rows["day_of_week"])
+        if "day_of_month" in rows:
+            np.copyto(rows["day_of_month"], day_of_month)
+        if "day_of_year" in rows:
+            np.add((dates - years).astype(np.int64), 1, out=rows["day_of_year"])
+        if "week_of_month" in rows:
+            np.add((day_of_month - 1) // 7, 1, out=rows["week_of_month"])
+        if "week_of_year" in rows:
+            # ISO weeks belong to the year of their Thursday and are counted from its first Thursday
+            thursdays = (days - (days + 3) % 7 + 3).astype("datetime64[D]")
+            iso_years = thursdays.astype("datetime64[Y]")
+            np.add(
+                (thursdays - iso_years).astype(np.int64) // 7,
+                1,
+                out=rows["week_of_year"],
+            )
+        if "month" in rows:
+            np.add((months - years).astype(np.int64), 1, out=rows["month"])
+        if "year" in rows:
+            np.add(years.astype(np.int64), 1970, out=rows["year"])
+
+        if index.hasnans:
+            block[:, np.asarray(index.isna())] = np.nan
+
+        return block.T
 
 
 class DateIndicator(BaseEstimator, TransformerMixin):
@@ -205,6 +239,9 @@ class DateIndicator(BaseEstimator, TransformerMixin):
         A list containing the dates of the holiday. You have to state every holiday explicitly, i.e.
         Christmas from 2018 to 2020 can be encoded as ["2018-12-24", "2019-12-24", "2020-12-24"].
 
+    dtype : type, default=np.int8
+        The type of the new column. Use bool for a boolean mask, or a wider integer type if a downstream step needs it.
+
     Examples
     --------
     >>> import pandas as pd
@@ -220,19 +257,22 @@ class DateIndicator(BaseEstimator, TransformerMixin):
     2020-01-04  6                     0
     """
 
-    def __init__(self, name: str, dates: List[str]) -> None:
+    def __init__(self, name: str, dates: List[str], dtype: type = np.int8) -> None:
         """Initialize."""
         self.name = name
         self.dates = dates
+        self.dtype = dtype
 
     def fit(self, X: pd.DataFrame, y=None) -> DateIndicator:
         """
-        Fit the estimator. In this special case, nothing is done.
+        Fit the estimator.
+
+        In this special case, only the dates are parsed.
 
         Parameters
         ----------
-        X : Ignored
-            Not used, present here for API consistency by convention.
+        X : pd.DataFrame
+            Only used for checking the number of features.
 
         y : Ignored
             Not used, present here for API consistency by convention.
@@ -249,6 +289,8 @@ class DateIndicator(BaseEstimator, TransformerMixin):
         else:
             self.dates_ = self.dates
 
+        self._parsed_dates_ = pd.DatetimeIndex(self.dates_)
+
         return self
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
@@ -269,6 +311,38 @@ class DateIndicator(BaseEstimator, TransformerMixin):
         check_array(X, dtype=None)
         self._check_n_features(X, reset=False)
 
-        return X.assign(
-            **{self.name: lambda df: df.index.isin(self.dates_).astype(int)}
-        )
+        if not isinstance(X.index, pd.DatetimeIndex):
+            return X.assign(**{self.name: np.zeros(len(X), dtype=self.dtype)})
+
+        # dates are compared as wall times, so they never fall into a DST gap and match both instants of a fold
+        timestamps = _nanoseconds(X.index.tz_localize(None))
+        sorted_dates = np.unique(_nanoseconds(self._wall_times(X.index.tz)))
+        if len(sorted_dates) > _MAX_DIRECT_DATE_COMPARISONS:
+            positions = np.searchsorted(sorted_dates, timestamps)
+            is_date = sorted_dates.take(positions, mode="clip") == timestamps
+        else:
+            # a few linear passes beat a binary search per timestamp
+            is_date = np.zeros(len(timestamps), dtype=bool)
+            for date in sorted_dates:
+                is_date |= timestamps == date
+
+        return X.assign(**{self.name: is_date.astype(self.dtype)})
+
+    def _wall_times(self, tz: Any) -> pd.DatetimeIndex:
+        """
+        Express the parsed dates as naive wall times in the timezone of the index they are compared to.
+
+        Parameters
+        ----------
+        tz : Any
+            The timezone of the index, or None for a naive index.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            The naive dates as they are, and tz-aware dates converted to `tz` without their timezone.
+        """
+        if self._parsed_dates_.tz is None:
+            return self._parsed_dates_
+
+        return self._parsed_dates_.tz_convert(tz).tz_localize(None)
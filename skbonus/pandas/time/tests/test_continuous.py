@@ -0,0 +1,40 @@
+"""Test the continuous time feature transformers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from skbonus.pandas.time import PowerTrend
+
+
+@pytest.mark.parametrize("rows", [[0, 3, 5, 9], [1, 2, 8]])
+def test_power_trend_daily_across_dst_change(rows):
+    """Test if a daily trend counts calendar days on a tz-aware index with a DST change."""
+    index = pd.date_range("2020-03-25", periods=10, freq="D", tz="Europe/Berlin")
+    df = pd.DataFrame({"A": range(len(index))}, index=index)
+    pt = PowerTrend().fit(df)
+
+    np.testing.assert_array_equal(pt.transform(df.iloc[rows])["trend"], rows)
+
+
+def test_power_trend_regular_slice_across_dst_change():
+    """Test if a regular tz-aware slice after a DST change continues the daily trend."""
+    index = pd.date_range("2020-03-25", periods=10, freq="D", tz="Europe/Berlin")
+    df = pd.DataFrame({"A": range(len(index))}, index=index)
+    pt = PowerTrend(power=2.0).fit(df)
+
+    np.testing.assert_array_equal(
+        pt.transform(df.iloc[5:])["trend"], np.arange(5, 10) ** 2.0
+    )
+
+
+@pytest.mark.parametrize("frequency, first_step", [("15T", 96), ("D", 1)])
+def test_power_trend_naive_origin_on_tz_aware_index(frequency, first_step):
+    """Test if a naive origin date is taken as a wall time in the timezone of the index."""
+    index = pd.date_range("2020-01-02", periods=5, freq=frequency, tz="Europe/Berlin")
+    df = pd.DataFrame({"A": range(len(index))}, index=index)
+    pt = PowerTrend(origin_date="2020-01-01").fit(df)
+
+    np.testing.assert_array_equal(
+        pt.transform(df)["trend"], np.arange(first_step, first_step + 5)
+    )
@@ -0,0 +1,104 @@
+"""Test the simple time feature transformers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from skbonus.pandas.time import DateIndicator, SimpleTimeFeatures
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.DatetimeIndex(
+            np.random.RandomState(0).randint(-(10**18), 10**18, size=1000)
+        ),
+        pd.date_range("2020-03-28", periods=100, freq="H", tz="Europe/Berlin"),
+        pd.DatetimeIndex(["2020-02-29 23:59:59", None, "1969-12-31 00:00:01"]),
+    ],
+)
+def test_simple_time_features_match_pandas(index):
+    """Test if the time features match the ones of pandas' datetime accessors."""
+    df = pd.DataFrame({"A": range(len(index))}, index=index)
+    features = SimpleTimeFeatures(
+        second=True,
+        minute=True,
+        hour=True,
+        day_of_week=True,
+        day_of_month=True,
+        day_of_year=True,
+        week_of_month=True,
+        week_of_year=True,
+        month=True,
+        year=True,
+    ).fit_transform(df)
+
+    expected = {
+        "second": index.second,
+        "minute": index.minute,
+        "hour": index.hour,
+        "day_of_week": index.weekday + 1,
+        "day_of_month": index.day,
+        "day_of_year": index.dayofyear,
+        "week_of_month": np.ceil(index.day / 7),
+        "week_of_year": index.isocalendar().week.astype(float),
+        "month": index.month,
+        "year": index.year,
+    }
+    for name, values in expected.items():
+        np.testing.assert_array_equal(features[name], values)
+
+
+@pytest.mark.parametrize("tz", [None, "UTC", "Europe/Berlin"])
+@pytest.mark.parametrize("n_dates", [0, 1, 5, 50])
+def test_date_indicator_matches_isin(n_dates, tz):
+    """Test if the date indicator marks exactly the dates in the index that are also in dates, taken as wall times."""
+    index = pd.date_range("2019-12-01", periods=24 * 366, freq="H", tz=tz)
+    wall_times = index.tz_localize(None)
+    # the last two dates fall into the DST gap and fold in Europe/Berlin
+    dates = [str(date) for date in wall_times[::9][:n_dates]] + [
+        "1988-08-08",
+        "2020-03-29 02:00",
+        "2020-10-25 02:00",
+    ]
+    df = pd.DataFrame({"A": range(len(index))}, index=index)
+
+    np.testing.assert_array_equal(
+        DateIndicator("special", dates).fit_transform(df)["special"],
+        wall_times.isin(dates).astype(int),
+    )
+
+
+def test_date_indicator_dtype():
+    """Test if the date indicator is an int8 column by default and a boolean mask with dtype=bool."""
+    index = pd.date_range("2019-12-29", periods=7)
+    df = pd.DataFrame({"A": range(7)}, index=index)
+    dates = ["2019-12-31", "2020-01-01"]
+
+    assert DateIndicator("special", dates).fit_transform(df)["special"].dtype == np.int8
+
+    mask = DateIndicator("special", dates, dtype=bool).fit_transform(df)["special"]
+    assert mask.dtype == bool
+    np.testing.assert_array_equal(mask, index.isin(dates))
+
+
+def test_date_indicator_without_datetime_index():
+    """Test if the date indicator finds no dates in an index without dates."""
+    df = pd.DataFrame({"A": range(5)})
+
+    np.testing.assert_array_equal(
+        DateIndicator("special", ["2020-01-01"]).fit_transform(df)["special"],
+        np.zeros(5),
+    )
+
+
+def test_simple_time_features_use_fitted_features():
+    """Test if transform adds the features chosen during fit, even if the flags were changed afterwards."""
+    index = pd.date_range("2020-01-01", periods=100, freq="17min")
+    df = pd.DataFrame({"A": range(len(index))}, index=index)
+    stf = SimpleTimeFeatures(hour=True, minute=True).fit(df)
+    expected = stf.transform(df)
+
+    pd.testing.assert_frame_equal(
+        stf.set_params(minute=False, second=True).transform(df), expected
+    )
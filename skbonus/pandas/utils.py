@@ -2,6 +2,7 @@
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -30,3 +31,20 @@ def make_df_output(estimator: Any) -> Any:
             return pd.DataFrame(out, columns=cols, index=index)
 
     return TransformerWithDataFrameOutput
+
+
+def _nanoseconds(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Get the dates of an index as integer nanoseconds since the epoch, whatever resolution the index has.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        The dates. Tz-aware dates are counted in UTC, missing ones become the smallest int64.
+
+    Returns
+    -------
+    np.ndarray
+        The nanoseconds as int64, without a copy if the index already stores nanoseconds.
+    """
+    return np.asarray(index, dtype="datetime64[ns]").view(np.int64)
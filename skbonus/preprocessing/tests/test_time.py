@@ -25,3 +25,14 @@ def test_cyclical_encoder():
             ]
         ),
     )
+
+
+def test_cyclical_encoder_dtype():
+    """Test if the CyclicalEncoder encodes in the requested floating point type."""
+    minutes = np.arange(60).reshape(-1, 1)
+    ce_transformed = CyclicalEncoder(dtype=np.float32).fit_transform(minutes)
+
+    assert ce_transformed.dtype == np.float32
+    np.testing.assert_allclose(
+        ce_transformed, CyclicalEncoder().fit_transform(minutes), atol=1e-6
+    )
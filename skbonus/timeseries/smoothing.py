@@ -5,7 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 
 import numpy as np
-from scipy.signal import convolve2d
+from scipy.ndimage import convolve1d
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils import check_array
 from sklearn.utils.validation import check_is_fitted
@@ -41,7 +41,7 @@ class Smoother(BaseEstimator, TransformerMixin, ABC):
     @abstractmethod
     def _set_sliding_window(self) -> None:
         """
-        Calculate the sliding window.
+        Calculate the sliding window, normalized to sum up to one.
 
         Returns
         -------
@@ -70,9 +70,6 @@ class Smoother(BaseEstimator, TransformerMixin, ABC):
         X = check_array(X)
         self._check_n_features(X, reset=True)
         self._set_sliding_window()
-        self.sliding_window_ = (
-            self.sliding_window_.reshape(-1, 1) / self.sliding_window_.sum()
-        )
 
         return self
 
@@ -91,16 +88,35 @@ class Smoother(BaseEstimator, TransformerMixin, ABC):
             The input dataframe with an additional column for special dates.
         """
         check_is_fitted(self)
-        X = check_array(X)
+        X = check_array(X, dtype=[np.float64, np.float32])
         self._check_n_features(X, reset=False)
 
-        convolution = convolve2d(X, self.sliding_window_, mode=self.mode)
+        window = len(self.sliding_window_)
+        if window == 1:
+            # the normalized window is just [1.0], so smoothing does not change the data
+            return X.copy()
+
+        # row i of the output is row i + first_row of the full convolution
+        first_row = {"full": 0, "same": (window - 1) // 2, "valid": window - 1}[
+            self.mode
+        ]
+        convolution = convolve1d(
+            X,
+            self.sliding_window_,
+            axis=0,
+            output=X.dtype,
+            mode="constant",
+            origin=first_row - window // 2,
+        )
 
-        if self.mode == "full" and self.window > 1:
-            convolution = convolution[: -self.window + 1]
+        if self.mode == "valid":
+            convolution = convolution[: max(len(X) - window + 1, 0)]
 
         return convolution
 
+    def _more_tags(self):
+        return {"preserves_dtype": [np.float64, np.float32]}
+
 
 class GeneralGaussianSmoother(Smoother):
     """
@@ -172,7 +188,7 @@ class GeneralGaussianSmoother(Smoother):
 
     def _set_sliding_window(self) -> None:
         """
-        Calculate the sliding window.
+        Calculate the sliding window, normalized to sum up to one.
 
         Returns
         -------
@@ -183,20 +199,24 @@ class GeneralGaussianSmoother(Smoother):
         ValueError
             If the provided value for `tails` is not "left", "right" or "both".
         """
-        self.sliding_window_ = np.exp(
-            -0.5
-            * np.abs(np.arange(-self.window // 2 + 1, self.window // 2 + 1) / self.sig)
-            ** (2 * self.p)
-        )
+        x = np.arange(-self.window // 2 + 1, self.window // 2 + 1) / self.sig
+        if self.p == 1:
+            sliding_window = np.exp(-0.5 * x * x)
+        elif self.p == 0.5:
+            sliding_window = np.exp(-0.5 * np.abs(x))
+        else:
+            sliding_window = np.exp(-0.5 * np.abs(x) ** (2 * self.p))
         if self.tails == "left":
-            self.sliding_window_[self.window // 2 + 1 :] = 0
+            sliding_window[self.window // 2 + 1 :] = 0
         elif self.tails == "right":
-            self.sliding_window_[: self.window // 2] = 0
+            sliding_window[: self.window // 2] = 0
         elif self.tails != "both":
             raise ValueError(
                 "tails keyword has to be one of 'both', 'left' or 'right'."
             )
 
+        self.sliding_window_ = sliding_window / sliding_window.sum()
+
 
 class ExponentialDecaySmoother(Smoother):
     """
@@ -267,12 +287,14 @@ class ExponentialDecaySmoother(Smoother):
 
     def _set_sliding_window(self) -> None:
         """
-        Calculate the sliding window.
+        Calculate the sliding window, normalized to sum up to one.
 
         Returns
         -------
         None
         """
-        self.sliding_window_ = self.strength ** (
+        sliding_window = self.strength ** (
             np.abs(np.arange(self.window) - self.peak) ** self.exponent
         )
+
+        self.sliding_window_ = sliding_window / sliding_window.sum()
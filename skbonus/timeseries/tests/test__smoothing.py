@@ -0,0 +1,38 @@
+"""Test the Smoother base class."""
+
+import numpy as np
+import pytest
+from scipy.signal import convolve2d
+
+from ..smoothing import Smoother
+
+
+class _RandomSmoother(Smoother):
+    """Smoother with an asymmetric random sliding window, so a flipped or shifted convolution shows."""
+
+    def _set_sliding_window(self) -> None:
+        sliding_window = np.random.RandomState(self.window).uniform(size=self.window)
+        self.sliding_window_ = sliding_window / sliding_window.sum()
+
+
+@pytest.mark.parametrize("mode", ["full", "same", "valid"])
+@pytest.mark.parametrize("window", [1, 2, 3, 4, 7, 8])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_smoother_matches_convolve2d(mode, window, dtype):
+    """Test if the smoothing matches scipy's convolve2d in every mode and keeps the floating point type."""
+    X = np.random.RandomState(0).randn(20, 3).astype(dtype)
+    smoother = _RandomSmoother(window=window, mode=mode).fit(X)
+    smoothed = smoother.transform(X)
+
+    expected = convolve2d(X, smoother.sliding_window_.reshape(-1, 1), mode=mode)
+    if mode == "full":
+        # the full convolution is cut back to the length of the input
+        expected = expected[: len(X)]
+
+    assert smoothed.dtype == dtype
+    np.testing.assert_allclose(
+        smoothed,
+        expected,
+        rtol=1e-5 if dtype == np.float32 else 1e-7,
+        atol=1e-6 if dtype == np.float32 else 1e-12,
+    )